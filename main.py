@@ -1,37 +1,87 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta, timezone
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import count
 from threading import Lock
-from typing import Dict, Final, List
+from time import time as unix_time
+from typing import Any, Dict, Final, List, Tuple
 from uuid import uuid4
 
 from zoneinfo import ZoneInfo
 
-from fastapi import FastAPI, HTTPException, Path, status
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Path, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
 
 APP_TZ = ZoneInfo("Europe/Helsinki")
 
 BUSINESS_START = time(8, 0)
 BUSINESS_END = time(16, 0)
 
+# Office hours as minutes since local midnight, for integer comparisons.
+BUSINESS_START_MIN: Final[int] = BUSINESS_START.hour * 60 + BUSINESS_START.minute
+BUSINESS_END_MIN: Final[int] = BUSINESS_END.hour * 60 + BUSINESS_END.minute
+
 MIN_DURATION = timedelta(minutes=30)
 MAX_DURATION = timedelta(hours=8)
 
-ROOMS: Final[set[str]] = {"A", "B"}
+ROOMS: Final[frozenset[str]] = frozenset({"A", "B"})
+_ROOMS_SORTED: Final[list[str]] = sorted(ROOMS)
+
+# Date part every accepted ISO 8601 timestamp starts with (YYYY-MM-DD).
+_ISO_DATE_PREFIX: Final[re.Pattern[str]] = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
 
+# (epoch minute, start of that minute in UTC) of the last now_utc_floor_minute call.
+_now_floor_cache: Tuple[int, datetime] = (-1, datetime.min.replace(tzinfo=timezone.utc))
 
-def now_utc() -> datetime:
+
+def now_utc_floor_minute() -> datetime:
     """
-    Returns the current timestamp in UTC.
+    Returns the current timestamp in UTC floored to the minute.
+
+    The result is cached for the current wall-clock minute, so requests
+    arriving within the same minute reuse the same datetime instead of
+    constructing a new one. The cache is replaced as a single tuple, so
+    concurrent callers always see a consistent pair.
 
     Returns
     -------
-    now: datetime
-        Current time as timezone-aware datetime in UTC.
+    now_floor: datetime
+        Start of the current minute as timezone-aware datetime in UTC.
     """
-    return datetime.now(timezone.utc)
+    global _now_floor_cache
+    epoch_min = int(unix_time()) // 60
+    cached_min, cached_floor = _now_floor_cache
+    if cached_min != epoch_min:
+        cached_floor = datetime.fromtimestamp(epoch_min * 60, tz=timezone.utc)
+        _now_floor_cache = (epoch_min, cached_floor)
+    return cached_floor
+
+
+# Random per-process prefix plus a monotonic counter; see new_reservation_id.
+_ID_PREFIX: Final[str] = uuid4().hex[:12]
+_id_counter = count(1)
+
+
+def new_reservation_id() -> str:
+    """
+    Generates a new unique reservation identifier.
+
+    The id is a random per-process prefix followed by a monotonically
+    increasing counter in hex. Unlike uuid4(), no random bytes are read
+    from the OS per reservation, and next() on itertools.count is atomic,
+    so no locking is needed. Ids are opaque strings to API clients.
+
+    Returns
+    -------
+    reservation_id: str
+        Identifier unique within the lifetime of the process.
+    """
+    return f"{_ID_PREFIX}-{next(_id_counter):012x}"
 
 
 def ensure_room(room_id: str) -> str:
@@ -39,6 +89,7 @@ def ensure_room(room_id: str) -> str:
     Normalizes and validates the room identifier.
 
     The room id is normalized to uppercase and checked against the allowed rooms.
+    Ids that are already uppercase are returned without normalizing.
     Raises an HTTP 404 error if the room is not supported.
 
     Parameters
@@ -56,44 +107,39 @@ def ensure_room(room_id: str) -> str:
     HTTPException
         If the room id is not found among the allowed rooms.
     """
+    if room_id in ROOMS:
+        return room_id
     room_id = room_id.upper()
     if room_id not in ROOMS:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Room '{room_id}' not found. Allowed rooms: {sorted(ROOMS)}",
+            detail=f"Room '{room_id}' not found. Allowed rooms: {_ROOMS_SORTED}",
         )
     return room_id
 
 
-def parse_iso_to_utc(iso_str: str) -> datetime:
+def to_utc(dt: datetime) -> datetime:
     """
-    Parses an ISO 8601 timestamp into a timezone-aware UTC datetime.
+    Normalizes a parsed request timestamp into a timezone-aware UTC datetime.
 
-    If the input timestamp is naive (no timezone offset), it is interpreted as
+    If the timestamp is naive (no timezone offset), it is interpreted as
     Europe/Helsinki local time. The returned datetime is always normalized to UTC.
 
     Parameters
     ----------
-    iso_str: str
-        Timestamp in ISO 8601 format. Naive timestamps are treated as Europe/Helsinki.
+    dt: datetime
+        Timestamp parsed from the request. Naive timestamps are treated as
+        Europe/Helsinki.
 
     Returns
     -------
     dt_utc: datetime
         Timezone-aware datetime in UTC.
-
-    Raises
-    ------
-    HTTPException
-        If the input is not a valid ISO 8601 timestamp.
     """
-    try:
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid ISO 8601 datetime: '{iso_str}'")
-
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=APP_TZ)
+        # Naive local time: subtract the Helsinki offset directly instead of
+        # attaching APP_TZ and converting with astimezone().
+        return (dt - APP_TZ.utcoffset(dt)).replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
@@ -119,30 +165,31 @@ def to_helsinki(dt_utc: datetime) -> datetime:
     return dt_utc.astimezone(APP_TZ)
 
 
-def overlaps(a_start: datetime, a_end: datetime, b_start: datetime, b_end: datetime) -> bool:
+def slot_mask(start_local: datetime, end_local: datetime) -> int:
     """
-    Checks whether two time intervals overlap.
+    Converts a local time interval into a bitmask of 30-minute slots.
 
-    The intervals are treated as half-open intervals: [start, end),
-    meaning the start time is inclusive and the end time is exclusive.
+    Office hours 08:00–16:00 are divided into 16 consecutive 30-minute slots,
+    where bit i represents the i-th slot of the day. The interval is treated
+    as half-open [start, end), so two intervals overlap exactly when their
+    masks share a bit. The interval must already satisfy the business rules
+    (30-minute blocks within office hours of a single local day).
 
     Parameters
     ----------
-    a_start: datetime
-        Start time of the first interval.
-    a_end: datetime
-        End time of the first interval.
-    b_start: datetime
-        Start time of the second interval.
-    b_end: datetime
-        End time of the second interval.
+    start_local: datetime
+        Start time in Europe/Helsinki local time.
+    end_local: datetime
+        End time in Europe/Helsinki local time.
 
     Returns
     -------
-    overlaps: bool
-        True if the intervals overlap, False otherwise.
+    mask: int
+        Bitmask with one bit set for each slot covered by the interval.
     """
-    return a_start < b_end and b_start < a_end
+    start_slot = (start_local.hour * 60 + start_local.minute - BUSINESS_START_MIN) // 30
+    end_slot = (end_local.hour * 60 + end_local.minute - BUSINESS_START_MIN) // 30
+    return ((1 << (end_slot - start_slot)) - 1) << start_slot
 
 
 def validate_time_order(start_utc: datetime, end_utc: datetime) -> None:
@@ -190,9 +237,7 @@ def validate_not_in_past(start_utc: datetime) -> None:
     HTTPException
         If the reservation start time is in the past.
     """
-    now = now_utc()
-    now_floor_to_minute = now.replace(second=0, microsecond=0)
-    if start_utc < now_floor_to_minute:
+    if start_utc < now_utc_floor_minute():
         raise HTTPException(status_code=400, detail="Reservation start time cannot be in the past.")
 
 
@@ -201,6 +246,9 @@ def validate_30_min_blocks_local(start_local: datetime, end_local: datetime) ->
     Validates that reservation start and end times align to 30-minute blocks
     in Europe/Helsinki local time.
 
+    Times with non-zero seconds or microseconds do not fall on a block
+    boundary and are rejected as well.
+
     Parameters
     ----------
     start_local: datetime
@@ -215,9 +263,16 @@ def validate_30_min_blocks_local(start_local: datetime, end_local: datetime) ->
     Raises
     ------
     HTTPException
-        If start or end time is not at xx:00 or xx:30 local time.
-    """
-    if start_local.minute % 30 != 0 or end_local.minute % 30 != 0:
+        If start or end time is not exactly at xx:00 or xx:30 local time.
+    """
+    if (
+        start_local.minute % 30 != 0
+        or end_local.minute % 30 != 0
+        or start_local.second != 0
+        or end_local.second != 0
+        or start_local.microsecond != 0
+        or end_local.microsecond != 0
+    ):
         raise HTTPException(
             status_code=400,
             detail="Reservations must start and end at 30-minute intervals (xx:00 or xx:30).",
@@ -280,7 +335,9 @@ def validate_business_hours_local(start_local: datetime, end_local: datetime) ->
     Validates that the reservation is within office hours in local time.
 
     Office hours are 08:00–16:00 (Europe/Helsinki). Start at exactly 16:00
-    is not allowed because the office closes at that time.
+    is not allowed because the office closes at that time. The checks compare
+    minutes since local midnight; validate_30_min_blocks_local has already
+    rejected times with seconds or microseconds.
 
     Parameters
     ----------
@@ -298,17 +355,20 @@ def validate_business_hours_local(start_local: datetime, end_local: datetime) ->
     HTTPException
         If the reservation start or end is outside office hours, or starts at 16:00.
     """
-    if not (BUSINESS_START <= start_local.timetz().replace(tzinfo=None) <= BUSINESS_END):
+    start_min = start_local.hour * 60 + start_local.minute
+    end_min = end_local.hour * 60 + end_local.minute
+
+    if not (BUSINESS_START_MIN <= start_min <= BUSINESS_END_MIN):
         raise HTTPException(status_code=400, detail="Reservation start must be within office hours 08:00–16:00.")
 
-    if not (BUSINESS_START <= end_local.timetz().replace(tzinfo=None) <= BUSINESS_END):
+    if not (BUSINESS_START_MIN <= end_min <= BUSINESS_END_MIN):
         raise HTTPException(status_code=400, detail="Reservation end must be within office hours 08:00–16:00.")
 
-    if start_local.time() == BUSINESS_END:
+    if start_min == BUSINESS_END_MIN:
         raise HTTPException(status_code=400, detail="Reservation cannot start at 16:00 (office closes).")
 
 
-def validate_business_rules(start_utc: datetime, end_utc: datetime) -> None:
+def validate_business_rules(start_utc: datetime, end_utc: datetime) -> Tuple[datetime, datetime]:
     """
     Validates business rules for a room reservation time interval.
 
@@ -325,35 +385,78 @@ def validate_business_rules(start_utc: datetime, end_utc: datetime) -> None:
 
     Returns
     -------
-    None
+    local_times: Tuple[datetime, datetime]
+        Reservation start and end times converted to Europe/Helsinki local
+        time, so callers do not need to convert them again.
 
     Raises
     ------
     HTTPException
         If any of the business rules are violated.
     """
+    # Checks that only need the UTC times run first, so invalid requests
+    # are rejected before any timezone conversion.
     validate_time_order(start_utc, end_utc)
+    validate_duration_limits(start_utc, end_utc)
     validate_not_in_past(start_utc)
 
-    start_local = to_helsinki(start_utc)
-    end_local = to_helsinki(end_utc)
+    # Inputs are always timezone-aware UTC here, so convert directly instead
+    # of going through to_helsinki()'s naive-input handling. The C zoneinfo
+    # conversion is cheaper than deriving local times from a cached offset
+    # and checking for DST transitions in Python.
+    start_local = start_utc.astimezone(APP_TZ)
+    end_local = end_utc.astimezone(APP_TZ)
 
     validate_30_min_blocks_local(start_local, end_local)
-    validate_duration_limits(start_utc, end_utc)
     validate_single_local_day(start_local, end_local)
     validate_business_hours_local(start_local, end_local)
 
+    return start_local, end_local
+
 
 class CreateReservationRequest(BaseModel):
     """
     Request model for creating a new room reservation.
 
-    The start and end times must be provided in ISO 8601 format.
-    If the timestamp does not include a timezone offset, it is
-    interpreted as Europe/Helsinki local time.
+    The start and end times must be provided as ISO 8601 strings and are
+    parsed by Pydantic; invalid timestamps are rejected with HTTP 422.
+    Values that do not start with a YYYY-MM-DD date, such as Unix
+    timestamps given as numbers or numeric strings, are rejected with
+    HTTP 422 as well. If the timestamp does not include a timezone
+    offset, it is interpreted as Europe/Helsinki local time.
     """
-    start: str = Field(..., description="ISO 8601 datetime (local Europe/Helsinki if no offset)")
-    end: str = Field(..., description="ISO 8601 datetime (local Europe/Helsinki if no offset)")
+    start: datetime = Field(..., description="ISO 8601 datetime (local Europe/Helsinki if no offset)")
+    end: datetime = Field(..., description="ISO 8601 datetime (local Europe/Helsinki if no offset)")
+
+
+    @field_validator("start", "end", mode="before")
+    @classmethod
+    def require_iso_string(cls, value: Any) -> Any:
+        """
+        Rejects timestamps that are not ISO 8601 strings.
+
+        The value must be a string starting with a YYYY-MM-DD date.
+        Pydantic would otherwise read numbers and numeric strings in any
+        form, such as "1790000000", "1.79e9" or ".5", as Unix timestamps.
+
+        Parameters
+        ----------
+        value: Any
+            Raw field value from the request body.
+
+        Returns
+        -------
+        value: Any
+            The unchanged value.
+
+        Raises
+        ------
+        ValueError
+            If the value is not a string starting with a YYYY-MM-DD date.
+        """
+        if not isinstance(value, str) or not _ISO_DATE_PREFIX.match(value):
+            raise ValueError("Timestamp must be an ISO 8601 datetime, not a Unix timestamp.")
+        return value
 
 
 class ReservationResponse(BaseModel):
@@ -361,7 +464,9 @@ class ReservationResponse(BaseModel):
     Response model representing a room reservation.
 
     All timestamps are returned in ISO 8601 format using
-    Europe/Helsinki local time.
+    Europe/Helsinki local time. The model documents the response schema;
+    the endpoints build the JSON directly from the stored reservation,
+    which has already been validated.
     """
     id: str
     room: str
@@ -369,27 +474,62 @@ class ReservationResponse(BaseModel):
     end: str    # ISO 8601 in Europe/Helsinki
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Reservation:
     """
     Internal domain model representing a room reservation.
 
     The reservation times are stored internally in UTC to ensure
-    consistent comparison and overlap detection.
+    consistent comparison and overlap detection. The Europe/Helsinki local
+    times are formatted as ISO 8601 strings once at creation time, so
+    responses can return them as-is. Instances use __slots__ (no per-instance
+    __dict__); the store never mutates a reservation after creating it.
+    The start time as integer epoch seconds (start_ts) and the JSON
+    representation used by the list endpoint (json_row) are computed once
+    in __post_init__.
     """
     id: str
     room: str
     start_utc: datetime
     end_utc: datetime
+    start_local_iso: str
+    end_local_iso: str
+    start_ts: int = field(init=False, repr=False, compare=False)
+    json_row: bytes = field(init=False, repr=False, compare=False)
+
+
+    def __post_init__(self) -> None:
+        """
+        Computes the derived fields of the reservation.
+
+        start_ts is the start time in whole epoch seconds, used as the sort
+        key in the store. json_row renders the reservation as a JSON object
+        in the ReservationResponse shape. Its fields are inserted without
+        escaping: ids, room identifiers and ISO 8601 timestamps never contain
+        quotes, backslashes or control characters. This invariant is asserted
+        here, when the reservation is created.
+        """
+        row = (
+            f'{{"id":"{self.id}","room":"{self.room}",'
+            f'"start":"{self.start_local_iso}","end":"{self.end_local_iso}"}}'
+        )
+        assert row.isascii() and row.isprintable() and "\\" not in row and row.count('"') == 16, (
+            f"Reservation fields must not require JSON escaping: {row}"
+        )
+        self.start_ts = int(self.start_utc.timestamp())
+        self.json_row = row.encode()
 
 
 class InMemoryStore:
     """
     Thread-safe in-memory storage for room reservations.
 
-    Reservations are stored per room and kept in UTC for consistent
-    comparison and overlap detection. This storage is intended for
-    demo and development use only (no persistence).
+    Reservations are stored per room in UTC, sorted by start time. Overlap
+    detection uses a bitmask of occupied 30-minute slots per room and local
+    day. Writes are serialized per room; after each write an immutable
+    snapshot of the room's reservations is published, so reads need no lock.
+    This storage is intended for demo and development use only
+    (no persistence).
     """
 
 
@@ -397,18 +537,53 @@ class InMemoryStore:
         """
         Initializes the in-memory reservation store.
 
-        Creates an empty reservation list for each supported room and
-        initializes a lock to ensure thread-safe access.
+        Creates an empty reservation list, a parallel list of start times as
+        epoch seconds, an id index, an empty published snapshot and a write
+        lock for each supported room, plus an empty slot bitmask table keyed
+        by (room, local date). The lists are kept sorted by start time; the
+        start time list lets bisect compare plain integers without a key
+        function.
         """
-        self._lock: Lock = Lock()
+        self._locks: Dict[str, Lock] = {room: Lock() for room in ROOMS}
         self._by_room: Dict[str, List[Reservation]] = {room: [] for room in ROOMS}
+        self._starts: Dict[str, List[int]] = {room: [] for room in ROOMS}
+        self._index: Dict[str, Dict[str, Reservation]] = {room: {} for room in ROOMS}
+        self._snapshots: Dict[str, Tuple[Reservation, ...]] = {room: () for room in ROOMS}
+        self._day_masks: Dict[Tuple[str, date], int] = {}
 
 
-    def list_room(self, room: str) -> List[Reservation]:
+    def clear(self) -> None:
+        """
+        Removes all reservations from the store.
+
+        All room locks are held while the per-room structures are replaced
+        with empty ones, so no write can interleave with the reset.
+
+        Returns
+        -------
+        None
+        """
+        locks = [self._locks[room] for room in _ROOMS_SORTED]
+        for lock in locks:
+            lock.acquire()
+        try:
+            self._by_room = {room: [] for room in ROOMS}
+            self._starts = {room: [] for room in ROOMS}
+            self._index = {room: {} for room in ROOMS}
+            self._snapshots = {room: () for room in ROOMS}
+            self._day_masks = {}
+        finally:
+            for lock in locks:
+                lock.release()
+
+
+    def list_room(self, room: str) -> Tuple[Reservation, ...]:
         """
         Returns all reservations for a given room.
 
         The reservations are returned sorted by start time in ascending order.
+        The room's latest published snapshot is returned without taking a
+        lock; writers replace the snapshot rather than modifying it.
 
         Parameters
         ----------
@@ -417,11 +592,10 @@ class InMemoryStore:
 
         Returns
         -------
-        reservations: List[Reservation]
-            List of reservations for the room, sorted by start time.
+        reservations: Tuple[Reservation, ...]
+            Immutable snapshot of the room's reservations, sorted by start time.
         """
-        with self._lock:
-            return sorted(self._by_room[room], key=lambda r: r.start_utc)
+        return self._snapshots[room]
 
 
     def create(self, room: str, start_utc: datetime, end_utc: datetime) -> Reservation:
@@ -429,7 +603,9 @@ class InMemoryStore:
         Creates a new reservation for a room.
 
         The reservation is validated against business rules and checked
-        for overlaps with existing reservations in the same room.
+        for overlaps with existing reservations in the same room. The
+        overlap check is a single bitwise AND against the slot mask of the
+        room's local day.
 
         Parameters
         ----------
@@ -451,24 +627,78 @@ class InMemoryStore:
             If business rules are violated or the reservation overlaps
             with an existing reservation in the same room.
         """
-        validate_business_rules(start_utc, end_utc)
+        start_local, end_local = validate_business_rules(start_utc, end_utc)
+        return self._add(room, start_utc, end_utc, start_local, end_local)
+
+
+    def _add(
+        self,
+        room: str,
+        start_utc: datetime,
+        end_utc: datetime,
+        start_local: datetime,
+        end_local: datetime,
+    ) -> Reservation:
+        """
+        Stores a new reservation for a room without validating business rules.
 
-        with self._lock:
-            existing = self._by_room[room]
-            for r in existing:
-                if overlaps(start_utc, end_utc, r.start_utc, r.end_utc):
-                    raise HTTPException(
-                        status_code=status.HTTP_409_CONFLICT,
-                        detail="Reservation overlaps with an existing reservation in the same room.",
-                    )
+        The reservation is only checked for overlaps with existing
+        reservations in the same room. The interval must still consist of
+        30-minute blocks within office hours of a single local day, as the
+        overlap check relies on the day's slot mask. Other rules, such as
+        the past-start rule, are not applied.
+
+        Parameters
+        ----------
+        room: str
+            Normalized room identifier.
+        start_utc: datetime
+            Reservation start time in UTC.
+        end_utc: datetime
+            Reservation end time in UTC.
+        start_local: datetime
+            Reservation start time in Europe/Helsinki local time.
+        end_local: datetime
+            Reservation end time in Europe/Helsinki local time.
+
+        Returns
+        -------
+        reservation: Reservation
+            The newly stored reservation.
+
+        Raises
+        ------
+        HTTPException
+            If the reservation overlaps with an existing reservation in the
+            same room.
+        """
+        day_key = (room, start_local.date())
+        new_mask = slot_mask(start_local, end_local)
+
+        with self._locks[room]:
+            day_mask = self._day_masks.get(day_key, 0)
+            if day_mask & new_mask:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Reservation overlaps with an existing reservation in the same room.",
+                )
 
             new_res = Reservation(
-                id=str(uuid4()),
+                id=new_reservation_id(),
                 room=room,
                 start_utc=start_utc,
                 end_utc=end_utc,
+                start_local_iso=start_local.isoformat(),
+                end_local_iso=end_local.isoformat(),
             )
-            existing.append(new_res)
+            existing = self._by_room[room]
+            starts = self._starts[room]
+            idx = bisect_right(starts, new_res.start_ts)
+            starts.insert(idx, new_res.start_ts)
+            existing.insert(idx, new_res)
+            self._index[room][new_res.id] = new_res
+            self._day_masks[day_key] = day_mask | new_mask
+            self._snapshots[room] = tuple(existing)
             return new_res
 
 
@@ -476,6 +706,9 @@ class InMemoryStore:
         """
         Deletes an existing reservation from a room.
 
+        The reservation is looked up by id from the room's index and its
+        position in the sorted lists is found by bisecting on its start time.
+
         Parameters
         ----------
         room: str
@@ -492,12 +725,27 @@ class InMemoryStore:
         HTTPException
             If the reservation with the given id does not exist.
         """
-        with self._lock:
-            reservations = self._by_room[room]
-            for i, r in enumerate(reservations):
-                if r.id == reservation_id:
-                    reservations.pop(i)
-                    return
+        with self._locks[room]:
+            r = self._index[room].pop(reservation_id, None)
+            if r is not None:
+                reservations = self._by_room[room]
+                starts = self._starts[room]
+                # Start times within a room are unique because reservations
+                # never overlap, so bisect finds the exact position.
+                i = bisect_left(starts, r.start_ts)
+                reservations.pop(i)
+                starts.pop(i)
+                start_local = to_helsinki(r.start_utc)
+                day_key = (room, start_local.date())
+                # Reservations in a room never overlap, so the removed
+                # reservation owns its slot bits exclusively.
+                day_mask = self._day_masks.get(day_key, 0) & ~slot_mask(start_local, to_helsinki(r.end_utc))
+                if day_mask:
+                    self._day_masks[day_key] = day_mask
+                else:
+                    self._day_masks.pop(day_key, None)
+                self._snapshots[room] = tuple(reservations)
+                return
 
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -506,34 +754,37 @@ class InMemoryStore:
 
 
 store = InMemoryStore()
-app = FastAPI(title="Meeting Room Booking API", version="1.0.0")
+app = FastAPI(
+    title="Meeting Room Booking API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 
-def to_response(r: Reservation) -> ReservationResponse:
+def to_response(r: Reservation) -> Dict[str, str]:
     """
-    Converts an internal Reservation object into an API response model.
+    Converts an internal Reservation object into an API response dict.
 
-    The reservation timestamps are converted from UTC to Europe/Helsinki
-    local time and formatted as ISO 8601 strings.
+    The reservation's Europe/Helsinki local timestamps are already
+    formatted as ISO 8601 strings, so no conversion is needed.
 
     Parameters
     ----------
     r: Reservation
-        Internal reservation domain object with UTC timestamps.
+        Internal reservation domain object.
 
     Returns
     -------
-    response: ReservationResponse
-        Reservation response model with timestamps in Europe/Helsinki local time.
+    response: Dict[str, str]
+        Reservation in the ReservationResponse shape with timestamps in
+        Europe/Helsinki local time.
     """
-    start_local = to_helsinki(r.start_utc).isoformat()
-    end_local = to_helsinki(r.end_utc).isoformat()
-    return ReservationResponse(
-        id=r.id,
-        room=r.room,
-        start=start_local,
-        end=end_local,
-    )
+    return {
+        "id": r.id,
+        "room": r.room,
+        "start": r.start_local_iso,
+        "end": r.end_local_iso,
+    }
 
 
 @app.post(
@@ -544,13 +795,14 @@ def to_response(r: Reservation) -> ReservationResponse:
 def create_reservation(
     room_id: str = Path(..., description="Room id (A or B)"),
     body: CreateReservationRequest = ...,
-) -> ReservationResponse:
+) -> ORJSONResponse:
     """
     Creates a new reservation for a given room.
 
     The request body must contain start and end times in ISO 8601 format.
     Business rules and overlap checks are applied before the reservation
-    is stored.
+    is stored. The response is returned directly, so FastAPI skips
+    validating it against the response model.
 
     Parameters
     ----------
@@ -561,7 +813,7 @@ def create_reservation(
 
     Returns
     -------
-    reservation: ReservationResponse
+    response: ORJSONResponse
         The newly created reservation with timestamps in Europe/Helsinki
         local time.
 
@@ -572,10 +824,10 @@ def create_reservation(
         reservation overlaps with an existing reservation.
     """
     room = ensure_room(room_id)
-    start_utc = parse_iso_to_utc(body.start)
-    end_utc = parse_iso_to_utc(body.end)
+    start_utc = to_utc(body.start)
+    end_utc = to_utc(body.end)
     created = store.create(room, start_utc, end_utc)
-    return to_response(created)
+    return ORJSONResponse(content=to_response(created), status_code=status.HTTP_201_CREATED)
 
 
 @app.get(
@@ -584,13 +836,15 @@ def create_reservation(
 )
 def list_reservations(
     room_id: str = Path(..., description="Room id (A or B)")
-) -> list[ReservationResponse]:
+) -> Response:
     """
     Returns all reservations for a given room.
 
     The reservations are returned in ascending order by start time.
     This endpoint returns all reservations regardless of whether they
-    are in the past or future.
+    are in the past or future. The JSON body is assembled from each
+    reservation's pre-rendered json_row, so no JSON encoder runs and
+    FastAPI skips validating it against the response model.
 
     Parameters
     ----------
@@ -599,7 +853,7 @@ def list_reservations(
 
     Returns
     -------
-    reservations: list[ReservationResponse]
+    response: Response
         List of reservations for the room with timestamps in
         Europe/Helsinki local time.
 
@@ -610,7 +864,8 @@ def list_reservations(
     """
     room = ensure_room(room_id)
     reservations = store.list_room(room)
-    return [to_response(r) for r in reservations]
+    body = b"[" + b",".join([r.json_row for r in reservations]) + b"]"
+    return Response(content=body, media_type="application/json")
 
 
 @app.delete(
@@ -619,7 +874,7 @@ def list_reservations(
 )
 def delete_reservation(
     room_id: str = Path(..., description="Room id (A or B)"),
-    reservation_id: str = Path(..., description="Reservation id (UUID)"),
+    reservation_id: str = Path(..., description="Reservation id"),
 ) -> None:
     """
     Deletes an existing reservation from a room.
@@ -0,0 +1,184 @@
+import gc
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import (
+    BUSINESS_END_MIN,
+    BUSINESS_START_MIN,
+    to_helsinki,
+    to_utc,
+)
+
+
+def pytest_configure(config):
+    """
+    Registers the custom markers used by the test suite.
+
+    Tests marked "slow" create reservations through the full HTTP POST
+    path; they can be skipped during development with -m "not slow".
+    """
+    config.addinivalue_line("markers", "slow: full HTTP path tests")
+
+
+@pytest.fixture(name="app", scope="session")
+def app_fixture():
+    """
+    Provides the FastAPI application under test.
+
+    Test modules and the other fixtures take the application and the
+    store from the app and store fixtures instead of importing them from
+    main, so main is imported only here.
+    """
+    return main.app
+
+
+@pytest.fixture(name="store", scope="session")
+def store_fixture():
+    """
+    Provides the application's in-memory reservation store.
+
+    Tests use the store to inspect state directly rather than through
+    the list endpoint.
+    """
+    return main.store
+
+
+@pytest.fixture(scope="session")
+def client(app, store):
+    """
+    Provides a single TestClient shared by the whole test session.
+
+    The client is not entered as a context manager: the application has
+    no startup or shutdown handlers, so running the lifespan protocol and
+    its event-loop portal would only add overhead. At the end of the
+    session the client is closed, the store is cleared and a garbage
+    collection is forced so that memory does not accumulate in long runs.
+    """
+    c = TestClient(app)
+    yield c
+    c.close()
+    store.clear()
+    gc.collect()
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """
+    Selects asyncio as the backend for tests marked with @pytest.mark.anyio.
+
+    The fixture is session-scoped so that the session-scoped async_client
+    fixture can be used from async tests.
+    """
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_client(app):
+    """
+    Provides a single asynchronous client shared by the whole test session.
+
+    The client calls the application directly through httpx's ASGI
+    transport, so independent requests can be awaited together with
+    asyncio.gather in a single event loop instead of one blocking
+    TestClient round trip after another.
+    """
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def clean_store(request, store):
+    """
+    Clears the in-memory reservation store after the test.
+
+    Tests that add reservations request this fixture, usually with
+    @pytest.mark.usefixtures("clean_store"), so they do not affect each
+    other through shared in-memory state. Tests that never modify the
+    store skip it. The store is cleared by a finalizer rather than a
+    generator fixture.
+    """
+    request.addfinalizer(store.clear)
+
+
+@pytest.fixture(scope="session")
+def seed(store):
+    """
+    Provides a helper for inserting reservations directly into the store.
+
+    The helper bypasses the HTTP stack and the business rules, so tests
+    that do not exercise the POST endpoint can set up data cheaply,
+    including reservations in the past. Overlaps are still rejected.
+    The helper does not clean up; function-scoped tests should use
+    seed_reservation instead, and wider-scoped fixtures must clear the
+    store themselves.
+
+    Returns
+    -------
+    seed: Callable[[str, datetime, datetime], str]
+        Function taking a room identifier and start and end times (naive
+        times are Europe/Helsinki) and returning the id of the stored
+        reservation.
+    """
+    def _seed(room: str, start: datetime, end: datetime) -> str:
+        start_utc = to_utc(start)
+        end_utc = to_utc(end)
+        reservation = store._add(room, start_utc, end_utc, to_helsinki(start_utc), to_helsinki(end_utc))
+        return reservation.id
+
+    return _seed
+
+
+@pytest.fixture
+def seed_reservation(clean_store, seed):
+    """
+    Provides the seed helper for a single test.
+
+    Using this fixture also clears the store after the test.
+
+    Returns
+    -------
+    seed: Callable[[str, datetime, datetime], str]
+        The helper provided by the seed fixture.
+    """
+    return seed
+
+
+@pytest.fixture(scope="session")
+def seed_many(store):
+    """
+    Provides a helper for bulk-inserting many reservations into the store.
+
+    The reservations are consecutive 30-minute blocks filling office hours
+    day by day, starting from the given local day. They are stored through
+    the store's _add, like seed, so no HTTP requests or business rule
+    checks are involved. Like seed, the helper does not clean up.
+
+    Returns
+    -------
+    seed_many: Callable[[str, int, Optional[date]], List[str]]
+        Function taking a room identifier, the number of reservations and
+        the first local day (defaults to tomorrow), and returning the ids
+        of the stored reservations in start time order.
+    """
+    per_day = (BUSINESS_END_MIN - BUSINESS_START_MIN) // 30
+    block = timedelta(minutes=30)
+
+    def _seed_many(room: str, n: int, first_day: Optional[date] = None) -> List[str]:
+        day = first_day or date.today() + timedelta(days=1)
+        ids = []
+        for i in range(n):
+            day_offset, slot = divmod(i, per_day)
+            start = datetime.combine(day + timedelta(days=day_offset), datetime.min.time())
+            start += timedelta(minutes=BUSINESS_START_MIN + slot * 30)
+            start_utc = to_utc(start)
+            end_utc = to_utc(start + block)
+            reservation = store._add(room, start_utc, end_utc, to_helsinki(start_utc), to_helsinki(end_utc))
+            ids.append(reservation.id)
+        return ids
+
+    return _seed_many
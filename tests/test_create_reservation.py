@@ -1,25 +1,30 @@
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
-from main import app, store
-
-client = TestClient(app)
+HELSINKI = ZoneInfo("Europe/Helsinki")
 
+# A day a week ahead, so reservations made through the API are never in the past.
+DAY = date.today() + timedelta(days=7)
+T09 = f"{DAY}T09:00:00"
+T0930 = f"{DAY}T09:30:00"
+T10 = f"{DAY}T10:00:00"
+T1030 = f"{DAY}T10:30:00"
+T15 = f"{DAY}T15:00:00"
+DT09 = datetime.combine(DAY, time(9, 0), tzinfo=HELSINKI)
+DT10 = datetime.combine(DAY, time(10, 0), tzinfo=HELSINKI)
+DT11 = datetime.combine(DAY, time(11, 0), tzinfo=HELSINKI)
+DT12 = datetime.combine(DAY, time(12, 0), tzinfo=HELSINKI)
+DT13 = datetime.combine(DAY, time(13, 0), tzinfo=HELSINKI)
 
-@pytest.fixture(autouse=True)
-def clear_store():
-    """
-    Clears the in-memory reservation store before each test.
 
-    This fixture runs automatically for every test case to ensure
-    that tests remain independent and do not affect each other
-    through shared in-memory state.
-    """
-    for room in store._by_room:
-        store._by_room[room].clear()
-
-
-def test_create_reservation_success():
+@pytest.mark.slow
+@pytest.mark.usefixtures("clean_store")
+def test_create_reservation_success(client: TestClient):
     """
     Tests successful creation of a reservation.
 
@@ -30,8 +35,8 @@ def test_create_reservation_success():
     response = client.post(
         "/rooms/A/reservations",
         json={
-            "start": "2026-02-02T09:00:00",
-            "end": "2026-02-02T10:00:00",
+            "start": T09,
+            "end": T10,
         },
     )
 
@@ -39,41 +44,171 @@ def test_create_reservation_success():
     body = response.json()
 
     assert body["room"] == "A"
-    assert body["start"].startswith("2026-02-02T09:00")
-    assert body["end"].startswith("2026-02-02T10:00")
+    assert body["start"].startswith(T09)
+    assert body["end"].startswith(T10)
     assert "id" in body
 
 
-def test_create_reservation_overlap():
+@pytest.mark.slow
+@pytest.mark.usefixtures("clean_store")
+def test_create_reservation_utc_timestamps(client: TestClient):
+    """
+    Tests that timestamps with a trailing "Z" are interpreted as UTC.
+
+    Creates a reservation using UTC timestamps and verifies that the
+    response returns the same instants in Europe/Helsinki local time.
+    """
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": DT09.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "end": DT10.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        },
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+
+    assert body["start"] == DT09.isoformat()
+    assert body["end"] == DT10.isoformat()
+
+
+@pytest.mark.slow
+def test_create_reservation_overlap(client: TestClient, seed_reservation):
     """
     Tests that overlapping reservations in the same room are rejected.
 
-    Creates an initial reservation and then attempts to create another
+    Seeds an initial reservation and then attempts to create another
     reservation that overlaps in time. The API must return HTTP 409.
     """
     # First reservation
-    client.post(
+    seed_reservation("A", DT09, DT10)
+
+    # Overlapping reservation
+    response = client.post(
         "/rooms/A/reservations",
         json={
-            "start": "2026-02-02T09:00:00",
-            "end": "2026-02-02T10:00:00",
+            "start": T0930,
+            "end": T1030,
         },
     )
 
-    # Overlapping reservation
+    assert response.status_code == 409
+    assert "overlaps" in response.json()["detail"].lower()
+
+
+@pytest.mark.slow
+def test_create_reservation_overlap_with_later_reservation(client: TestClient, seed_reservation):
+    """
+    Tests that a reservation overlapping a later reservation is rejected.
+
+    Seeds two reservations and then attempts to create a reservation
+    that starts before both of them but ends inside the earlier one.
+    Adjacent reservations (end == start) must still be accepted.
+    """
+    seed_reservation("A", DT10, DT11)
+    seed_reservation("A", DT12, DT13)
+
     response = client.post(
         "/rooms/A/reservations",
         json={
-            "start": "2026-02-02T09:30:00",
-            "end": "2026-02-02T10:30:00",
+            "start": T09,
+            "end": T1030,
         },
     )
 
     assert response.status_code == 409
-    assert "overlaps" in response.json()["detail"].lower()
 
+    # Adjacent reservation directly before the first one is allowed
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": T09,
+            "end": T10,
+        },
+    )
+
+    assert response.status_code == 201
+
+
+@pytest.mark.slow
+@pytest.mark.anyio
+@pytest.mark.usefixtures("clean_store")
+async def test_create_reservation_overlap_in_large_store(async_client: httpx.AsyncClient, seed, seed_many, store):
+    """
+    Tests overlap detection when a room already has many reservations.
+
+    Seeds one reservation after the bulk range and then fills room A with
+    1000 consecutive reservations starting from the test day, which must
+    be merged before it. Checks that an overlapping reservation is rejected
+    while the same interval in room B is accepted. The two requests are
+    independent and are sent concurrently.
+    """
+    later_day = DAY + timedelta(days=100)
+    later_id = seed(
+        "A",
+        datetime.combine(later_day, time(9, 0), tzinfo=HELSINKI),
+        datetime.combine(later_day, time(10, 0), tzinfo=HELSINKI),
+    )
+    ids = seed_many("A", 1000, DAY)
+
+    reservations = store.list_room("A")
+    assert [r.id for r in reservations] == ids + [later_id]
+    assert reservations[0].start_utc == DT09.replace(hour=8)
+
+    response_a, response_b = await asyncio.gather(
+        async_client.post(
+            "/rooms/A/reservations",
+            json={
+                "start": T09,
+                "end": T10,
+            },
+        ),
+        async_client.post(
+            "/rooms/B/reservations",
+            json={
+                "start": T09,
+                "end": T10,
+            },
+        ),
+    )
+
+    assert response_a.status_code == 409
+    assert response_b.status_code == 201
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("clean_store")
+def test_create_reservation_seconds_cannot_hide_overlap(client: TestClient):
+    """
+    Tests that times with seconds cannot hide an overlap.
 
-def test_create_reservation_invalid_time_interval():
+    A reservation from 09:00:30 to 10:00:30 would extend past 10:00, so a
+    following 10:00-10:30 reservation would overlap it. Such a request must
+    be rejected with HTTP 400, leaving 10:00-10:30 free to reserve.
+    """
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": f"{DAY}T09:00:30",
+            "end": f"{DAY}T10:00:30",
+        },
+    )
+
+    assert response.status_code == 400
+
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": T10,
+            "end": T1030,
+        },
+    )
+
+    assert response.status_code == 201
+
+
+def test_create_reservation_invalid_time_interval(client: TestClient):
     """
     Tests that a reservation with an invalid time interval is rejected.
 
@@ -83,8 +218,8 @@ def test_create_reservation_invalid_time_interval():
     response = client.post(
         "/rooms/A/reservations",
         json={
-            "start": "2026-02-02T10:00:00",
-            "end": "2026-02-02T09:00:00",
+            "start": T10,
+            "end": T09,
         },
     )
 
@@ -92,7 +227,69 @@ def test_create_reservation_invalid_time_interval():
     assert "start time must be before end time" in response.json()["detail"].lower()
 
 
-def test_create_reservation_nonexistent_room():
+def test_create_reservation_rejects_seconds(client: TestClient):
+    """
+    Tests that reservation times must fall exactly on 30-minute blocks.
+
+    Attempts to create a reservation ending a few seconds after office
+    hours close. The API must return HTTP 400.
+    """
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": T15,
+            "end": f"{DAY}T16:00:30",
+        },
+    )
+
+    assert response.status_code == 400
+    assert "30-minute intervals" in response.json()["detail"]
+
+
+def test_create_reservation_invalid_timestamp(client: TestClient):
+    """
+    Tests that a malformed timestamp is rejected.
+
+    Attempts to create a reservation with a start time that is not
+    valid ISO 8601. Request validation must return HTTP 422.
+    """
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": "not-a-timestamp",
+            "end": T10,
+        },
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "value",
+    [1790000000, "1790000000", "1.79e9", ".5"],
+    ids=["number", "numeric-string", "exponent-string", "leading-dot-string"],
+)
+def test_create_reservation_rejects_unix_timestamp(client: TestClient, value):
+    """
+    Tests that Unix timestamps are not accepted as reservation times.
+
+    Attempts to create a reservation with a start time given as epoch
+    seconds, both as a JSON number and as strings in integer, exponent and
+    leading-dot form. Only ISO 8601 strings are accepted, so request
+    validation must return HTTP 422.
+    """
+    response = client.post(
+        "/rooms/A/reservations",
+        json={
+            "start": value,
+            "end": T10,
+        },
+    )
+
+    assert response.status_code == 422
+
+
+def test_create_reservation_nonexistent_room(client: TestClient):
     """
     Tests that creating a reservation for a non-existent room fails.
 
@@ -102,8 +299,8 @@ def test_create_reservation_nonexistent_room():
     response = client.post(
         "/rooms/X/reservations",
         json={
-            "start": "2026-02-02T09:00:00",
-            "end": "2026-02-02T10:00:00",
+            "start": T09,
+            "end": T10,
         },
     )
 
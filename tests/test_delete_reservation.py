@@ -1,29 +1,30 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
 import pytest
 from fastapi.testclient import TestClient
 
-from main import app, store
-
-client = TestClient(app)
+HELSINKI = ZoneInfo("Europe/Helsinki")
 
+# A day a week ahead, so reservations made through the API are never in the past.
+DAY = date.today() + timedelta(days=7)
+T0930 = f"{DAY}T09:30:00"
+T10 = f"{DAY}T10:00:00"
+T11 = f"{DAY}T11:00:00"
+DT09 = datetime.combine(DAY, time(9, 0), tzinfo=HELSINKI)
+DT10 = datetime.combine(DAY, time(10, 0), tzinfo=HELSINKI)
+DT11 = datetime.combine(DAY, time(11, 0), tzinfo=HELSINKI)
+DT12 = datetime.combine(DAY, time(12, 0), tzinfo=HELSINKI)
 
-@pytest.fixture(autouse=True)
-def clear_store():
-    """
-    Clears the in-memory reservation store before each test.
 
-    This fixture ensures that each test runs with a clean state so that
-    reservations created in one test do not affect other tests.
-    """
-    for room in store._by_room:
-        store._by_room[room].clear()
-
-
-def create_reservation(room: str, start: str, end: str) -> str:
+def create_reservation(client: TestClient, room: str, start: str, end: str) -> str:
     """
     Helper function to create a reservation via the API.
 
     Parameters
     ----------
+    client: TestClient
+        Test client used to send the request.
     room: str
         Room identifier (e.g. "A" or "B").
     start: str
@@ -44,78 +45,91 @@ def create_reservation(room: str, start: str, end: str) -> str:
     return response.json()["id"]
 
 
-@pytest.mark.parametrize("room", ["A", "B"])
-def test_delete_reservation_success(room: str):
+def test_delete_reservation_success(client: TestClient, seed_reservation, store):
     """
     Tests successful deletion of a reservation.
 
-    Creates a reservation for the given room, deletes it, and verifies
-    that the reservation no longer appears in the room's reservation list.
+    Seeds a reservation, deletes it, and verifies that the reservation
+    no longer appears in the store. Deleting from both rooms is covered
+    by test_delete_only_affects_correct_room.
     """
-    reservation_id = create_reservation(
-        room,
-        "2026-02-02T09:00:00",
-        "2026-02-02T10:00:00",
-    )
+    reservation_id = seed_reservation("A", DT09, DT10)
+
+    delete_response = client.delete(f"/rooms/A/reservations/{reservation_id}")
+    assert delete_response.status_code == 204
+
+    # Verify reservation is no longer stored
+    assert store.list_room("A") == ()
+
+
+@pytest.mark.slow
+def test_delete_frees_time_slot(client: TestClient, seed_reservation):
+    """
+    Tests that deleting a reservation frees its time slot.
 
-    delete_response = client.delete(f"/rooms/{room}/reservations/{reservation_id}")
+    Seeds a reservation next to another one in the same room, deletes
+    it and verifies that the same time can be reserved again while the
+    remaining reservation still blocks its own slot.
+    """
+    seed_reservation("A", DT09, DT10)
+    reservation_id = seed_reservation("A", DT10, DT11)
+
+    delete_response = client.delete(f"/rooms/A/reservations/{reservation_id}")
     assert delete_response.status_code == 204
 
-    # Verify reservation is no longer listed
-    list_response = client.get(f"/rooms/{room}/reservations")
-    assert list_response.status_code == 200
-    reservations = list_response.json()
+    create_reservation(client, "A", T10, T11)
 
-    assert reservations == []
+    response = client.post(
+        "/rooms/A/reservations",
+        json={"start": T0930, "end": T10},
+    )
+    assert response.status_code == 409
 
 
-@pytest.mark.parametrize("room", ["A", "B"])
-def test_delete_nonexistent_reservation(room: str):
+def test_delete_nonexistent_reservation(client: TestClient):
     """
     Tests deletion of a non-existent reservation.
 
     Attempts to delete a reservation with an id that does not exist.
     The API must return HTTP 404.
     """
-    response = client.delete(f"/rooms/{room}/reservations/nonexistent-id")
+    response = client.delete("/rooms/A/reservations/nonexistent-id")
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-@pytest.mark.parametrize("room", ["A", "B"])
-def test_delete_only_affects_correct_room(room: str):
+@pytest.mark.parametrize("room", ["A", "B"], ids=["delete-A-keep-B", "delete-B-keep-A"])
+def test_delete_only_affects_correct_room(client: TestClient, seed_reservation, store, room: str):
     """
     Tests that deleting a reservation only affects the specified room.
 
-    Creates one reservation in the target room and another in a different
+    Seeds one reservation in the target room and another in a different
     room. After deleting the reservation in the target room, verifies that
     the other room's reservation remains intact.
     """
     other_room = "B" if room == "A" else "A"
 
-    id_to_delete = create_reservation(
+    id_to_delete = seed_reservation(
         room,
-        "2026-02-02T09:00:00",
-        "2026-02-02T10:00:00",
+        DT09,
+        DT10,
     )
 
-    other_id = create_reservation(
+    other_id = seed_reservation(
         other_room,
-        "2026-02-02T11:00:00",
-        "2026-02-02T12:00:00",
+        DT11,
+        DT12,
     )
 
     delete_response = client.delete(f"/rooms/{room}/reservations/{id_to_delete}")
     assert delete_response.status_code == 204
 
     # Deleted room should be empty
-    response_room = client.get(f"/rooms/{room}/reservations")
-    assert response_room.json() == []
+    assert store.list_room(room) == ()
 
     # Other room must still contain its reservation
-    response_other = client.get(f"/rooms/{other_room}/reservations")
-    data_other = response_other.json()
+    data_other = store.list_room(other_room)
 
     assert len(data_other) == 1
-    assert data_other[0]["id"] == other_id
\ No newline at end of file
+    assert data_other[0].id == other_id
\ No newline at end of file
@@ -1,128 +1,108 @@
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
 import pytest
 from fastapi.testclient import TestClient
-from datetime import datetime, timezone, timedelta
-
-from main import Reservation, app, store
 
-client = TestClient(app)
+HELSINKI = ZoneInfo("Europe/Helsinki")
 
+# A day a week ahead, used for the future reservations.
+DAY = date.today() + timedelta(days=7)
+DT09 = datetime.combine(DAY, time(9, 0), tzinfo=HELSINKI)
+DT10 = datetime.combine(DAY, time(10, 0), tzinfo=HELSINKI)
+DT11 = datetime.combine(DAY, time(11, 0), tzinfo=HELSINKI)
+DT12 = datetime.combine(DAY, time(12, 0), tzinfo=HELSINKI)
 
-@pytest.fixture(autouse=True)
-def clear_store():
-    """
-    Clears the in-memory reservation store before each test.
-
-    This fixture runs automatically to ensure that each test starts
-    with a clean state and does not depend on reservations created
-    by previous tests.
-    """
-    for room in store._by_room:
-        store._by_room[room].clear()
+PAST_DAY = date.today() - timedelta(days=2)
+PAST_DT09 = datetime.combine(PAST_DAY, time(9, 0), tzinfo=HELSINKI)
+PAST_DT10 = datetime.combine(PAST_DAY, time(10, 0), tzinfo=HELSINKI)
 
 
-def create_reservation(room: str, start: str, end: str):
+@pytest.fixture(scope="module")
+def seeded_reservations(seed, store):
     """
-    Helper function for creating a reservation via the API.
+    Seeds a canonical set of reservations once for this module.
 
-    Parameters
-    ----------
-    room: str
-        Room identifier (e.g. "A" or "B").
-    start: str
-        Reservation start time in ISO 8601 format.
-    end: str
-        Reservation end time in ISO 8601 format.
+    Room A gets three future reservations, inserted out of
+    chronological order, and one past reservation, which the API itself
+    would reject. The tests in this module only read the list, so they
+    can share this state. The store is cleared after the module.
 
     Returns
     -------
-    response
-        HTTP response object returned by the API.
+    ids: Dict[str, str]
+        Reservation ids keyed by "past", "09", "10" and "11".
     """
-    return client.post(
-        f"/rooms/{room}/reservations",
-        json={"start": start, "end": end},
-    )
+    ids = {
+        "10": seed("A", DT10, DT11),
+        "09": seed("A", DT09, DT10),
+        "11": seed("A", DT11, DT12),
+        "past": seed("A", PAST_DT09, PAST_DT10),
+    }
+    yield ids
+    store.clear()
 
 
-def test_list_reservations_returns_sorted_by_start_time():
+def test_list_reservations_returns_sorted_by_start_time(client: TestClient, seeded_reservations):
     """
     Tests that reservations are returned sorted by start time.
 
-    Creates multiple reservations for the same room in a non-chronological
-    order and verifies that the API response lists them in ascending
-    order based on their start time.
+    Verifies that reservations seeded in a non-chronological order are
+    listed by the API in ascending order based on their start time.
     """
-    # Create reservations out of order
-    create_reservation("A", "2026-02-02T10:00:00", "2026-02-02T11:00:00")
-    create_reservation("A", "2026-02-02T09:00:00", "2026-02-02T10:00:00")
-    create_reservation("A", "2026-02-02T11:00:00", "2026-02-02T12:00:00")
-
     response = client.get("/rooms/A/reservations")
 
     assert response.status_code == 200
     data = response.json()
 
-    assert len(data) == 3
+    assert [item["id"] for item in data] == [
+        seeded_reservations["past"],
+        seeded_reservations["09"],
+        seeded_reservations["10"],
+        seeded_reservations["11"],
+    ]
 
     # Ensure ascending order by start time
     starts = [item["start"] for item in data]
     assert starts == sorted(starts)
 
 
-def test_list_reservations_response_format():
+def test_list_reservations_response_format(client: TestClient, seeded_reservations):
     """
     Tests the structure and data types of the reservation list response.
 
     Verifies that the endpoint returns a list of reservations and that
     each reservation contains the expected fields with correct types.
     """
-    create_reservation("A", "2026-02-02T09:00:00", "2026-02-02T10:00:00")
-
     response = client.get("/rooms/A/reservations")
 
     assert response.status_code == 200
     data = response.json()
 
     assert isinstance(data, list)
-    assert len(data) == 1
+    assert len(data) == len(seeded_reservations)
 
-    reservation = data[0]
+    for reservation in data:
+        assert reservation.keys() == {"id", "room", "start", "end"}
+        assert reservation["room"] == "A"
+        assert isinstance(reservation["id"], str)
+        assert isinstance(reservation["start"], str)
+        assert isinstance(reservation["end"], str)
 
-    assert set(reservation.keys()) == {"id", "room", "start", "end"}
-    assert reservation["room"] == "A"
-    assert isinstance(reservation["id"], str)
-    assert isinstance(reservation["start"], str)
-    assert isinstance(reservation["end"], str)
 
-
-def test_list_reservations_includes_past_reservations():
+def test_list_reservations_includes_past_reservations(client: TestClient, seeded_reservations):
     """
     Tests that past reservations are included in the reservation listing.
 
-    Inserts a past reservation directly into the in-memory store and
-    creates a future reservation via the API. Verifies that both past
-    and future reservations are returned by the list endpoint.
+    Verifies that both the past and the future reservations seeded into
+    the in-memory store are returned by the list endpoint.
     """
-    # Manually insert a past reservation into the store
-    past_start = datetime.now(timezone.utc) - timedelta(days=2)
-    past_end = past_start + timedelta(hours=1)
-
-    store._by_room["A"].append(
-        Reservation(
-            id="past-id",
-            room="A",
-            start_utc=past_start,
-            end_utc=past_end,
-        )
-    )
-
-    # Create a future reservation normally via API
-    create_reservation("A", "2026-02-03T09:00:00", "2026-02-03T10:00:00")
-
     response = client.get("/rooms/A/reservations")
 
     assert response.status_code == 200
     data = response.json()
 
     # Both past and future reservations must be returned
-    assert len(data) == 2
\ No newline at end of file
+    ids = {item["id"] for item in data}
+    assert seeded_reservations["past"] in ids
+    assert seeded_reservations["09"] in ids